@@ -12,6 +12,12 @@ class Settings(BaseSettings):
     output_dir: str = Field(default="outputs")
     max_upload_size_mb: int = Field(default=10)
     allowed_extensions: str = Field(default=".pdf")
+    pdf_max_pages: int = Field(default=50)
+    pdf_max_objects: int = Field(default=20000)
+    pdf_sandbox_enabled: bool = Field(default=True)
+    pdf_extract_cpu_seconds: int = Field(default=10)
+    pdf_extract_memory_mb: int = Field(default=512)
+    pdf_extract_timeout_seconds: float = Field(default=30.0)
     rate_limit_enabled: bool = Field(default=False)
     rate_limit_requests_per_minute: int = Field(default=60)
     google_api_key: str | None = Field(default=None, alias="GOOGLE_API_KEY")
@@ -0,0 +1,6 @@
+import sys
+
+from loadtest.runner import main
+
+
+sys.exit(main())
@@ -0,0 +1,195 @@
+import json
+import math
+import random
+import sys
+import threading
+import time
+import types
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional
+
+from config.settings import settings
+
+
+LatencySampler = Callable[[random.Random], float]
+
+
+def parse_latency(spec: str) -> LatencySampler:
+    """
+    Parse a latency distribution spec into a sampler returning seconds.
+
+    Supported specs (all values in milliseconds):
+        const:MS, uniform:LO:HI, normal:MEAN:STDDEV,
+        lognormal:MEDIAN:SIGMA, exp:MEAN
+    """
+    kind, _, rest = spec.strip().partition(":")
+    try:
+        args = [float(a) for a in rest.split(":")] if rest else []
+    except ValueError as e:
+        raise ValueError(f"Invalid latency spec: {spec!r}") from e
+    kind = kind.lower()
+    arity = {"const": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exp": 1}
+    if kind not in arity or len(args) != arity[kind]:
+        raise ValueError(f"Invalid latency spec: {spec!r}")
+    if any(a < 0 for a in args):
+        raise ValueError(f"Latency values must be non-negative: {spec!r}")
+
+    if kind == "const":
+        return lambda rng: args[0] / 1000
+    if kind == "uniform":
+        lo, hi = sorted(args)
+        return lambda rng: rng.uniform(lo, hi) / 1000
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(args[0], args[1])) / 1000
+    if kind == "lognormal":
+        mu = math.log(args[0]) if args[0] > 0 else 0.0
+        return lambda rng: rng.lognormvariate(mu, args[1]) / 1000
+    mean = args[0]
+    return lambda rng: (rng.expovariate(1 / mean) if mean > 0 else 0.0) / 1000
+
+
+@dataclass
+class FakeModelConfig:
+    latency: str = "lognormal:800:0.5"
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class FakeModelStats:
+    calls: int = 0
+    errors: int = 0
+    malformed: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+_TAILOR_PAYLOAD = {
+    "summary_enhancement": "Backend engineer with production FastAPI and AI delivery experience.",
+    "keyword_optimization": ["python", "fastapi", "llm", "rest apis"],
+    "skills_gap": ["kubernetes", "observability"],
+    "recommendations": [
+        "Quantify latency and throughput improvements.",
+        "Move AI projects above older roles.",
+    ],
+}
+
+_COVER_LETTER = (
+    "[Date]\n\n[Hiring Manager's Name]\n[Company Name]\n[Company Address]\n\n"
+    "Dear Hiring Manager,\n\n"
+    "I am excited to apply for this role. My experience building Python services, "
+    "shipping FastAPI backends and integrating language models into products maps "
+    "directly onto the requirements you describe. I have owned features end to end, "
+    "from design through monitoring in production, and I enjoy working closely with "
+    "product and design partners.\n\n"
+    "I would welcome the chance to discuss how I can contribute to your team.\n\n"
+    "Sincerely,\n[Your Name]"
+)
+
+_COVER_LETTER_PAYLOAD = {
+    "cover_letter": _COVER_LETTER,
+    "placeholders": {
+        "date": "[Date]",
+        "company_name": "[Company Name]",
+        "hiring_manager": "[Hiring Manager's Name]",
+        "company_address": "[Company Address]",
+        "your_name": "[Your Name]",
+    },
+}
+
+
+class FakeGenerativeModel:
+    """Stand-in for ``genai.GenerativeModel`` with configurable behaviour."""
+
+    def __init__(self, config: FakeModelConfig, stats: FakeModelStats, rng: random.Random):
+        self._config = config
+        self._stats = stats
+        self._rng = rng
+        self._rng_lock = threading.Lock()
+        self._sample_latency = parse_latency(config.latency)
+
+    def generate_content(self, prompt: str) -> FakeResponse:
+        with self._rng_lock:
+            delay = self._sample_latency(self._rng)
+            roll = self._rng.random()
+        time.sleep(delay)
+        with self._stats.lock:
+            self._stats.calls += 1
+            if roll < self._config.error_rate:
+                self._stats.errors += 1
+            elif roll < self._config.error_rate + self._config.malformed_rate:
+                self._stats.malformed += 1
+        if roll < self._config.error_rate:
+            raise RuntimeError("Fake Gemini backend error")
+        # Only generate_cover_letter's format instructions contain this key;
+        # user text in the tailor prompt may well mention "cover letter".
+        is_cover_letter = '"cover_letter":' in prompt
+        payload = _COVER_LETTER_PAYLOAD if is_cover_letter else _TAILOR_PAYLOAD
+        body = json.dumps(payload)
+        if roll < self._config.error_rate + self._config.malformed_rate:
+            # Truncate mid-object so extract_json_from_text succeeds but json.loads fails.
+            body = body[: len(body) // 2]
+        return FakeResponse("```json\n" + body + "\n```")
+
+
+def build_fake_module(config: FakeModelConfig, stats: FakeModelStats) -> types.ModuleType:
+    """Build a module exposing the subset of ``google.generativeai`` the services use."""
+    module = types.ModuleType("google.generativeai")
+    rng = random.Random(config.seed)
+    model = None
+
+    def configure(api_key: str | None = None, **_: object) -> None:
+        return None
+
+    def GenerativeModel(model_name: str, **_: object) -> FakeGenerativeModel:
+        nonlocal model
+        if model is None:
+            model = FakeGenerativeModel(config, stats, rng)
+        return model
+
+    module.configure = configure
+    module.GenerativeModel = GenerativeModel
+    return module
+
+
+@contextmanager
+def fake_gemini(config: FakeModelConfig, api_key: str = "fake-loadtest-key") -> Iterator[FakeModelStats]:
+    """
+    Route the services' ``google.generativeai`` calls to a local fake model.
+
+    A dummy API key is set so the real prompt/parse paths run instead of the
+    stub short-circuit. Everything is restored on exit.
+    """
+    stats = FakeModelStats()
+    module = build_fake_module(config, stats)
+    saved: Dict[str, Optional[types.ModuleType]] = {
+        name: sys.modules.get(name) for name in ("google", "google.generativeai")
+    }
+    parent = saved["google"] or types.ModuleType("google")
+    had_attr = hasattr(parent, "generativeai")
+    saved_attr = getattr(parent, "generativeai", None)
+    saved_key = settings.google_api_key
+
+    sys.modules["google"] = parent
+    sys.modules["google.generativeai"] = module
+    parent.generativeai = module
+    settings.google_api_key = api_key
+    try:
+        yield stats
+    finally:
+        settings.google_api_key = saved_key
+        if had_attr:
+            parent.generativeai = saved_attr
+        else:
+            del parent.generativeai
+        for name, mod in saved.items():
+            if mod is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = mod
@@ -0,0 +1,395 @@
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from loadtest.fake_gemini import FakeModelConfig, fake_gemini, parse_latency
+
+logger = logging.getLogger("ai-resume-tailor")
+
+ENDPOINTS = {
+    "upload": "/upload-resume",
+    "tailor": "/tailor",
+    "cover": "/generate-cover-letter",
+}
+
+SAMPLE_RESUME_TEXT = [
+    "Jane Doe",
+    "jane.doe@example.com +1 555 010 2030",
+    "Summary",
+    "Backend engineer building Python and FastAPI services.",
+    "Experience",
+    "Senior Engineer, Example Corp - shipped LLM features to production.",
+    "Skills",
+    "Python, FastAPI, PostgreSQL, Docker, REST APIs",
+]
+
+SAMPLE_JOB_DESCRIPTION = (
+    "We are hiring a backend engineer to design and operate Python FastAPI services, "
+    "integrate large language models, and own observability for production APIs."
+)
+
+
+def build_sample_pdf(
+    lines: Sequence[str] = SAMPLE_RESUME_TEXT, extra_objects: Sequence[bytes] = ()
+) -> bytes:
+    """Build a small single-page PDF with extractable text and optional extra objects."""
+    ops = ["BT", "/F1 11 Tf", "14 TL", "72 720 Td"]
+    for line in lines:
+        escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        ops.append(f"({escaped}) Tj T*")
+    ops.append("ET")
+    stream = "\n".join(ops).encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        *extra_objects,
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+    return bytes(out)
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse a workload mix such as ``upload=1,tailor=3,cover=1``."""
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip().lower()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown workload {name!r}; expected one of {sorted(ENDPOINTS)}")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError as e:
+            raise ValueError(f"Invalid weight for {name!r}: {weight!r}") from e
+        if mix[name] < 0:
+            raise ValueError(f"Weight for {name!r} must be non-negative")
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Workload mix must contain at least one positive weight")
+    return mix
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms)
+
+    @property
+    def failures(self) -> int:
+        return sum(n for code, n in self.statuses.items() if not 200 <= code < 300)
+
+    def summary(self, elapsed_s: float) -> Dict:
+        ordered = sorted(self.latencies_ms)
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "throughput_rps": self.requests / elapsed_s if elapsed_s > 0 else 0.0,
+            "p50_ms": percentile(ordered, 50),
+            "p90_ms": percentile(ordered, 90),
+            "p95_ms": percentile(ordered, 95),
+            "p99_ms": percentile(ordered, 99),
+            "max_ms": ordered[-1] if ordered else 0.0,
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+        }
+
+
+@dataclass
+class LoadResult:
+    elapsed_s: float
+    endpoints: Dict[str, EndpointStats]
+
+    def to_dict(self) -> Dict:
+        total = EndpointStats()
+        for stats in self.endpoints.values():
+            total.latencies_ms.extend(stats.latencies_ms)
+            total.statuses.update(stats.statuses)
+        report = {name: stats.summary(self.elapsed_s) for name, stats in self.endpoints.items()}
+        report["total"] = total.summary(self.elapsed_s)
+        return {"elapsed_s": self.elapsed_s, "endpoints": report}
+
+
+class LoadRunner:
+    """Drive a mixed upload/tailor/cover-letter workload against the API."""
+
+    def __init__(
+        self,
+        client,
+        mix: Dict[str, float],
+        concurrency: int,
+        duration_s: Optional[float] = None,
+        max_requests: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if duration_s is None and max_requests is None:
+            raise ValueError("Provide duration_s or max_requests")
+        self._client = client
+        self._names = list(mix)
+        self._weights = [mix[n] for n in self._names]
+        self._concurrency = concurrency
+        self._duration_s = duration_s
+        self._max_requests = max_requests
+        self._rng = random.Random(seed)
+        self._pdf = build_sample_pdf()
+        self._resume_ids: List[str] = []
+        self._issued = 0
+        self._stats = {name: EndpointStats() for name in self._names}
+
+    async def seed_resumes(self, count: int) -> None:
+        for _ in range(count):
+            resume_id = await self._upload(record=False)
+            if resume_id:
+                self._resume_ids.append(resume_id)
+        if not self._resume_ids and any(n != "upload" for n in self._names):
+            raise RuntimeError("Could not seed any resumes; is the server reachable?")
+
+    async def run(self) -> LoadResult:
+        start = time.perf_counter()
+        deadline = start + self._duration_s if self._duration_s is not None else None
+        await asyncio.gather(*(self._worker(deadline) for _ in range(self._concurrency)))
+        return LoadResult(elapsed_s=time.perf_counter() - start, endpoints=self._stats)
+
+    def _next_op(self, deadline: Optional[float]) -> Optional[str]:
+        if deadline is not None and time.perf_counter() >= deadline:
+            return None
+        if self._max_requests is not None and self._issued >= self._max_requests:
+            return None
+        self._issued += 1
+        return self._rng.choices(self._names, weights=self._weights)[0]
+
+    async def _worker(self, deadline: Optional[float]) -> None:
+        while True:
+            op = self._next_op(deadline)
+            if op is None:
+                return
+            if op == "upload":
+                await self._upload(record=True)
+            else:
+                await self._analyse(op)
+
+    async def _timed_post(self, op: str, record: bool, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await self._client.post(ENDPOINTS[op], **kwargs)
+            code = response.status_code
+        except Exception:
+            logger.exception("Load-test request to %s failed", ENDPOINTS[op])
+            response, code = None, 599
+        if record:
+            stats = self._stats[op]
+            stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+            stats.statuses[code] += 1
+        return response
+
+    async def _upload(self, record: bool) -> Optional[str]:
+        files = {"file": ("resume.pdf", self._pdf, "application/pdf")}
+        response = await self._timed_post("upload", record, files=files)
+        if response is None or response.status_code != 201:
+            return None
+        resume_id = response.json()["resume_id"]
+        if record:
+            self._resume_ids.append(resume_id)
+        return resume_id
+
+    async def _analyse(self, op: str) -> None:
+        payload = {
+            "resume_id": self._rng.choice(self._resume_ids) if self._resume_ids else "",
+            "job_description": SAMPLE_JOB_DESCRIPTION,
+        }
+        await self._timed_post(op, True, json=payload)
+
+
+def format_report(result: LoadResult, fake_stats=None) -> str:
+    report = result.to_dict()
+    header = f"{'endpoint':<10}{'reqs':>8}{'fail':>7}{'rps':>9}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    lines = [f"Elapsed: {result.elapsed_s:.2f}s (latencies in ms)", header, "-" * len(header)]
+    for name, row in report["endpoints"].items():
+        lines.append(
+            f"{name:<10}{row['requests']:>8}{row['failures']:>7}{row['throughput_rps']:>9.1f}"
+            f"{row['p50_ms']:>9.1f}{row['p90_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+            f"{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}"
+        )
+    for name, row in report["endpoints"].items():
+        lines.append(f"status codes [{name}]: {row['statuses']}")
+    if fake_stats is not None:
+        lines.append(
+            f"fake model: calls={fake_stats.calls} errors={fake_stats.errors} "
+            f"malformed={fake_stats.malformed}"
+        )
+    return "\n".join(lines)
+
+
+def add_fake_model_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--latency",
+        default="lognormal:800:0.5",
+        help="Fake model latency: const:MS, uniform:LO:HI, normal:MEAN:SD, lognormal:MEDIAN:SIGMA, exp:MEAN",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of model calls that raise")
+    parser.add_argument(
+        "--malformed-rate", type=float, default=0.0, help="Fraction of model calls returning broken JSON"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+
+
+def fake_model_config(args: argparse.Namespace) -> FakeModelConfig:
+    parse_latency(args.latency)
+    for name in ("error_rate", "malformed_rate"):
+        if not 0.0 <= getattr(args, name) <= 1.0:
+            raise ValueError(f"--{name.replace('_', '-')} must be between 0 and 1")
+    if args.error_rate + args.malformed_rate > 1.0:
+        raise ValueError("--error-rate plus --malformed-rate must not exceed 1")
+    return FakeModelConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest",
+        description="Load-test the AI Resume Tailor API against a local fake Gemini backend.",
+    )
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=None, help="Run length in seconds (default 30)")
+    parser.add_argument("--requests", type=int, default=None, help="Stop after this many requests")
+    parser.add_argument("--mix", default="upload=1,tailor=3,cover=1", help="Weighted workload mix")
+    parser.add_argument("--seed-resumes", type=int, default=5, help="Resumes uploaded before the run")
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Target an external server (start it with `python -m loadtest.server`) instead of a local one",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep app and HTTP client logging")
+    add_fake_model_args(parser)
+    return parser
+
+
+async def run_load(
+    base_url: str,
+    mix: Dict[str, float],
+    concurrency: int,
+    duration_s: Optional[float] = None,
+    max_requests: Optional[int] = None,
+    seed: Optional[int] = None,
+    seed_resumes: int = 5,
+) -> LoadResult:
+    import httpx
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+        runner = LoadRunner(
+            client,
+            mix,
+            concurrency=concurrency,
+            duration_s=duration_s,
+            max_requests=max_requests,
+            seed=seed,
+        )
+        await runner.seed_resumes(seed_resumes)
+        return await runner.run()
+
+
+def _run(args: argparse.Namespace, mix: Dict[str, float], base_url: str) -> LoadResult:
+    return asyncio.run(
+        run_load(
+            base_url,
+            mix,
+            concurrency=args.concurrency,
+            duration_s=args.duration,
+            max_requests=args.requests,
+            seed=args.seed,
+            seed_resumes=args.seed_resumes,
+        )
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.duration is None and args.requests is None:
+        args.duration = 30.0
+    try:
+        mix = parse_mix(args.mix)
+        config = fake_model_config(args)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.base_url:
+        # The fake model lives in the target server; configure it there instead.
+        ignored = [
+            "--" + name.replace("_", "-")
+            for name in ("latency", "error_rate", "malformed_rate")
+            if getattr(args, name) != parser.get_default(name)
+        ]
+        if ignored:
+            parser.error(
+                f"{', '.join(ignored)} cannot be used with --base-url; "
+                "pass them to `python -m loadtest.server` instead"
+            )
+
+    if not args.verbose:
+        # Injected model failures are expected; keep their tracebacks out of the report.
+        logging.disable(logging.CRITICAL)
+    if args.base_url:
+        fake_stats = None
+        result = _run(args, mix, args.base_url)
+    else:
+        # The app always runs behind a real server with its own event loop;
+        # sharing the load generator's loop would hide queueing delay.
+        from loadtest.server import serve_in_background, temporary_storage
+        from main import app
+
+        with fake_gemini(config) as fake_stats, temporary_storage(), serve_in_background(app) as base_url:
+            result = _run(args, mix, base_url)
+    if args.json:
+        payload = result.to_dict()
+        if fake_stats is not None:
+            payload["fake_model"] = {
+                "calls": fake_stats.calls,
+                "errors": fake_stats.errors,
+                "malformed": fake_stats.malformed,
+            }
+        print(json.dumps(payload, indent=2))
+    else:
+        print(format_report(result, fake_stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
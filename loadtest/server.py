@@ -0,0 +1,89 @@
+import argparse
+import socket
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from config.settings import settings
+from loadtest.fake_gemini import fake_gemini
+from loadtest.runner import add_fake_model_args, fake_model_config
+
+
+@contextmanager
+def temporary_storage() -> Iterator[Path]:
+    """Point the app's upload and output directories at a temp dir removed on exit."""
+    import main
+
+    saved = main.UPLOAD_PATH, main.OUTPUT_PATH
+    with tempfile.TemporaryDirectory(prefix="loadtest-") as tmp:
+        root = Path(tmp)
+        main.UPLOAD_PATH = root / "uploads"
+        main.OUTPUT_PATH = root / "outputs"
+        main.UPLOAD_PATH.mkdir()
+        main.OUTPUT_PATH.mkdir()
+        try:
+            yield root
+        finally:
+            main.UPLOAD_PATH, main.OUTPUT_PATH = saved
+
+
+@contextmanager
+def serve_in_background(app, host: str = "127.0.0.1", startup_timeout: float = 10.0) -> Iterator[str]:
+    """
+    Run ``app`` under uvicorn on an ephemeral port in a background thread.
+
+    The app gets its own event loop, so blocking calls inside endpoints queue
+    requests the way they would in production instead of stalling the load
+    generator. Yields the server's base URL.
+    """
+    import uvicorn
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + startup_timeout
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            sock.close()
+            raise RuntimeError("Load-test server failed to start")
+        time.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+        sock.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Serve ``main.app`` with Gemini calls routed to the local fake model."""
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest.server",
+        description="Run the API under uvicorn with a fake Gemini backend for load testing.",
+    )
+    parser.add_argument("--host", default=settings.app_host)
+    parser.add_argument("--port", type=int, default=settings.app_port)
+    add_fake_model_args(parser)
+    args = parser.parse_args(argv)
+    try:
+        config = fake_model_config(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    import uvicorn
+
+    with fake_gemini(config), temporary_storage():
+        from main import app
+
+        uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
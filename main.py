@@ -7,6 +7,7 @@ from typing import Optional
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Response
 from fastapi import status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -21,7 +22,14 @@ from models.schemas import (
     CoverLetterRequest,
     CoverLetterResponse,
 )
-from services.pdf_service import extract_text, extract_structured_info
+from services.pdf_service import (
+    PdfResourceLimitError,
+    PdfValidationError,
+    extract_structured_info,
+    extract_text,
+    extract_text_sandboxed,
+    preflight_check,
+)
 from services.ai_service import tailor_resume
 from utils.ai_engine import generate_cover_letter
 from utils.security import sanitize_filename, is_allowed_extension, within_size_limit
@@ -112,14 +120,37 @@ async def upload_resume(file: UploadFile = File(...)):
     size = len(buffer.getvalue())
     if not within_size_limit(size, settings.max_upload_size_mb):
         raise HTTPException(status_code=413, detail="File too large")
+    try:
+        await run_in_threadpool(
+            preflight_check, buffer.getvalue(), settings.pdf_max_pages, settings.pdf_max_objects
+        )
+    except PdfValidationError as e:
+        logger.warning(f"PDF rejected by pre-flight check: {e}")
+        raise HTTPException(status_code=422, detail=str(e)) from e
     resume_id = str(uuid.uuid4())
     destination = UPLOAD_PATH / f"{resume_id}{Path(filename).suffix}"
     with destination.open("wb") as f:
         f.write(buffer.getvalue())
     try:
-        text = extract_text(destination)
+        if settings.pdf_sandbox_enabled:
+            text = await run_in_threadpool(
+                extract_text_sandboxed,
+                destination,
+                max_pages=settings.pdf_max_pages,
+                cpu_seconds=settings.pdf_extract_cpu_seconds,
+                memory_mb=settings.pdf_extract_memory_mb,
+                timeout_seconds=settings.pdf_extract_timeout_seconds,
+            )
+        else:
+            text = extract_text(destination, max_pages=settings.pdf_max_pages)
         processed_path = OUTPUT_PATH / f"{resume_id}.txt"
         processed_path.write_text(text, encoding="utf-8")
+    except PdfValidationError as e:
+        logger.warning(f"PDF rejected during extraction: {e}")
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    except PdfResourceLimitError as e:
+        logger.warning(f"PDF extraction aborted: {e}")
+        raise HTTPException(status_code=422, detail="PDF exceeds processing limits") from e
     except Exception as e:
         logger.exception("PDF processing failed")
         raise HTTPException(status_code=422, detail="Failed to process PDF") from e
@@ -1,13 +1,123 @@
+from itertools import islice
 from pathlib import Path
+import multiprocessing
+import os
 import re
-from typing import Dict, List
+import signal
+from typing import Dict, Iterator, List, Optional
 from PyPDF2 import PdfReader
 
 from utils.text import clean_text, normalize_whitespace
 
 
-def extract_text(pdf_path: Path) -> str:
+# Exit code of a sandbox child that ran out of memory.
+SANDBOX_MEMORY_EXIT = 4
+
+_HEADER_WINDOW = 1024
+_TRAILER_WINDOW = 1024
+# How far startxref may point away from the actual xref section.
+_XREF_SLACK = 64
+# How far around a /Type marker to look for keys of the same dictionary.
+_DICT_WINDOW = 1024
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)\s+%%EOF", re.DOTALL)
+_OBJ_HEADER_RE = re.compile(rb"\d+\s+\d+\s+obj\b")
+# Every pattern below starts with a literal so scans stay linear and fast on
+# multi-megabyte uploads.
+_OBJ_KEYWORD_RE = re.compile(rb"obj(?<!endobj)\b")
+_OBJSTM_RE = re.compile(rb"/Type\s*/ObjStm\b")
+_PAGE_RE = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+_PAGES_RE = re.compile(rb"/Type\s*/Pages\b")
+_N_RE = re.compile(rb"/N\s+(\d+)")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+
+
+class PdfValidationError(ValueError):
+    """Raised when a PDF is malformed or exceeds the configured structural limits."""
+
+
+class PdfResourceLimitError(RuntimeError):
+    """Raised when sandboxed extraction exceeds its CPU, memory or time budget."""
+
+
+class PdfExtractionError(RuntimeError):
+    """Raised when sandboxed extraction fails; carries the child's original error."""
+
+
+def _dict_ints(data: bytes, marker_re: re.Pattern, key_re: re.Pattern) -> Iterator[int]:
+    """
+    Yield an integer key from each object containing a ``marker_re`` match.
+
+    Keys are only read within a fixed window around the marker, clipped to the
+    enclosing object, and markers inside an already scanned window are skipped,
+    so total work stays linear in the size of the upload.
+    """
+    scanned_to = 0
+    while True:
+        marker = marker_re.search(data, scanned_to)
+        if marker is None:
+            return
+        lo = max(scanned_to, marker.start() - _DICT_WINDOW)
+        header = data.rfind(b"obj", lo, marker.start())
+        lo = header if header != -1 else lo
+        hi = min(len(data), marker.end() + _DICT_WINDOW)
+        for terminator in (b"stream", b"endobj"):
+            found = data.find(terminator, marker.end(), hi)
+            if found != -1:
+                hi = found
+        match = key_re.search(data, lo, hi)
+        scanned_to = max(hi, marker.end())
+        yield int(match.group(1)) if match else 0
+
+
+def preflight_check(data: bytes, max_pages: int, max_objects: int) -> None:
+    """
+    Cheap structural checks run on the raw upload before PyPDF2 touches it.
+
+    Only scans bytes with regexes, so pathological files are rejected without
+    building any object graph.
+    """
+    if b"%PDF-" not in data[:_HEADER_WINDOW]:
+        raise PdfValidationError("Not a PDF file")
+    # PyPDF2 searches the whole file backwards for %%EOF, so trailing padding
+    # after the marker is accepted; mirror that instead of a fixed tail.
+    eof = data.rfind(b"%%EOF")
+    if eof == -1:
+        raise PdfValidationError("Missing PDF end-of-file marker")
+    tail = data[max(0, eof - _TRAILER_WINDOW):eof + len(b"%%EOF")]
+    xref_matches = _STARTXREF_RE.findall(tail)
+    if not xref_matches:
+        raise PdfValidationError("Missing PDF cross-reference pointer")
+    xref_offset = int(xref_matches[-1])
+    if xref_offset >= len(data):
+        raise PdfValidationError("PDF cross-reference offset out of range")
+    # Slightly-off startxref values are common and PyPDF2 recovers from them.
+    lo = max(0, xref_offset - _XREF_SLACK)
+    hi = xref_offset + _XREF_SLACK
+    if data.find(b"xref", lo, hi + 4) == -1 and not _OBJ_HEADER_RE.search(data, lo, hi + 32):
+        raise PdfValidationError("PDF cross-reference table not found")
+
+    objects = len(_OBJ_KEYWORD_RE.findall(data))
+    if objects > max_objects:
+        raise PdfValidationError(f"PDF has too many objects ({objects} > {max_objects})")
+    # Every marker counts as at least one object, which caps the loop at max_objects.
+    for compressed in _dict_ints(data, _OBJSTM_RE, _N_RE):
+        objects += max(1, compressed)
+        if objects > max_objects:
+            raise PdfValidationError(f"PDF has too many objects ({objects} > {max_objects})")
+
+    # Only /Pages tree nodes carry a page /Count; outline dictionaries also use /Count.
+    page_counts = list(islice(_dict_ints(data, _PAGES_RE, _COUNT_RE), max_objects + 1))
+    if len(page_counts) > max_objects:
+        raise PdfValidationError(f"PDF has too many objects ({len(page_counts)} > {max_objects})")
+    pages = max([len(_PAGE_RE.findall(data)), *page_counts])
+    if pages > max_pages:
+        raise PdfValidationError(f"PDF has too many pages ({pages} > {max_pages})")
+
+
+def extract_text(pdf_path: Path, max_pages: Optional[int] = None) -> str:
     reader = PdfReader(str(pdf_path))
+    if max_pages is not None and len(reader.pages) > max_pages:
+        raise PdfValidationError(f"PDF has too many pages ({len(reader.pages)} > {max_pages})")
     pages = []
     for page in reader.pages:
         pages.append(page.extract_text() or "")
@@ -17,6 +127,98 @@ def extract_text(pdf_path: Path) -> str:
     return text
 
 
+def _sandbox_context():
+    # forkserver preloads PyPDF2 once, so each sandbox child is a cheap fork
+    # of a small, clean process rather than a fresh interpreter. PyPDF2 comes
+    # from site-packages, so the preload works whatever the server's cwd is.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["PyPDF2"])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+_SANDBOX_CONTEXT = _sandbox_context()
+
+
+def _apply_resource_limits(cpu_seconds: int, memory_mb: int) -> None:
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows; the parent's wall-clock timeout still applies.
+        return
+    # SIGXCPU dumps core by default; never let a capped child write one.
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    limit = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _sandbox_worker(conn, pdf_path: str, max_pages: int, cpu_seconds: int, memory_mb: int) -> None:
+    _apply_resource_limits(cpu_seconds, memory_mb)
+    try:
+        conn.send(extract_text(Path(pdf_path), max_pages=max_pages))
+    except PdfValidationError as e:
+        conn.send(e)
+    except MemoryError:
+        # Reporting through the pipe would need to allocate; use the exit code.
+        os._exit(SANDBOX_MEMORY_EXIT)
+    except Exception as e:
+        # Arbitrary PyPDF2 exceptions may not pickle; forward their text instead.
+        conn.send(PdfExtractionError(f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def extract_text_sandboxed(
+    pdf_path: Path,
+    max_pages: int,
+    cpu_seconds: int,
+    memory_mb: int,
+    timeout_seconds: float,
+) -> str:
+    """
+    Run extract_text in a child process with CPU-time and memory caps.
+
+    A runaway document only kills its own child, never the API worker.
+    """
+    ctx = _SANDBOX_CONTEXT
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_sandbox_worker,
+        args=(send_conn, str(pdf_path), max_pages, cpu_seconds, memory_mb),
+        daemon=True,
+    )
+    proc.start()
+    send_conn.close()
+    try:
+        if not recv_conn.poll(timeout_seconds):
+            proc.kill()
+            proc.join()
+            raise PdfResourceLimitError("PDF extraction timed out")
+        try:
+            result = recv_conn.recv()
+        except EOFError:
+            result = None
+    finally:
+        recv_conn.close()
+    # The child has sent its result or died, so this only reaps it.
+    proc.join(1)
+    if proc.is_alive():
+        proc.kill()
+        proc.join()
+
+    if isinstance(result, (PdfValidationError, PdfExtractionError)):
+        raise result
+    if isinstance(result, str):
+        return result
+    if proc.exitcode == SANDBOX_MEMORY_EXIT:
+        raise PdfResourceLimitError("PDF extraction exceeded memory limit")
+    if proc.exitcode == -signal.SIGXCPU:
+        raise PdfResourceLimitError("PDF extraction exceeded CPU limit")
+    raise RuntimeError(f"PDF extraction failed (exit code {proc.exitcode})")
+
+
 def extract_structured_info(text: str) -> Dict[str, str | List[str]]:
     email = None
     phone = None
@@ -1,6 +1,9 @@
 import io
 from fastapi.testclient import TestClient
+import main
 from main import app
+from services.pdf_service import PdfResourceLimitError
+from loadtest.runner import build_sample_pdf
 
 
 client = TestClient(app)
@@ -25,3 +28,26 @@ def test_submit_job_and_upload_resume(monkeypatch):
             json={"resume_id": resume_id, "job_id": job_id},
         )
         assert r3.status_code == 200
+
+
+def test_upload_resume_rejected_by_preflight():
+    r = client.post(
+        "/upload-resume",
+        files={"file": ("resume.pdf", io.BytesIO(b"PK\x03\x04 not a pdf"), "application/pdf")},
+    )
+    assert r.status_code == 422
+    assert r.json()["detail"] == "Not a PDF file"
+
+
+def test_upload_resume_extraction_over_limits(monkeypatch):
+    def over_budget(*args, **kwargs):
+        raise PdfResourceLimitError("PDF extraction exceeded CPU limit")
+
+    monkeypatch.setattr(main.settings, "pdf_sandbox_enabled", True)
+    monkeypatch.setattr(main, "extract_text_sandboxed", over_budget)
+    r = client.post(
+        "/upload-resume",
+        files={"file": ("resume.pdf", io.BytesIO(build_sample_pdf(["Jane Doe"])), "application/pdf")},
+    )
+    assert r.status_code == 422
+    assert r.json()["detail"] == "PDF exceeds processing limits"
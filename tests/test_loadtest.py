@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+import pytest
+
+from loadtest.fake_gemini import FakeModelConfig, fake_gemini, parse_latency
+from loadtest.runner import main as loadtest_main, parse_mix, percentile, run_load
+from loadtest.server import serve_in_background, temporary_storage
+from main import app
+from services.ai_service import tailor_resume
+from utils.ai_engine import generate_cover_letter
+
+
+JOB = "We need a Python FastAPI engineer with AI experience and production ownership."
+
+
+def test_parse_latency_and_mix():
+    import random
+
+    assert parse_latency("const:250")(random.Random(0)) == 0.25
+    assert 0.01 <= parse_latency("uniform:10:20")(random.Random(0)) <= 0.02
+    with pytest.raises(ValueError):
+        parse_latency("gamma:1")
+    assert parse_mix("upload=1,tailor=3") == {"upload": 1.0, "tailor": 3.0}
+    with pytest.raises(ValueError):
+        parse_mix("download=1")
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 99) == 4
+
+
+def test_fake_backend_drives_real_parsing_paths():
+    with fake_gemini(FakeModelConfig(latency="const:0")) as stats:
+        result = tailor_resume("Python engineer", JOB)
+        letter = generate_cover_letter("Python engineer", JOB)
+    assert result["skills_gap"] == ["kubernetes", "observability"]
+    assert "Dear Hiring Manager" in letter["cover_letter"]
+    assert stats.calls == 2
+
+
+def test_fake_backend_tailor_prompt_mentioning_cover_letter():
+    with fake_gemini(FakeModelConfig(latency="const:0")):
+        result = tailor_resume("Python engineer", JOB + " Please attach a cover letter.")
+    assert result["skills_gap"] == ["kubernetes", "observability"]
+
+
+def test_fake_backend_malformed_json_surfaces_as_error():
+    with fake_gemini(FakeModelConfig(latency="const:0", malformed_rate=1.0)) as stats:
+        with pytest.raises(RuntimeError):
+            generate_cover_letter("Python engineer", JOB)
+    assert stats.malformed == 1
+
+
+def _run_load(config, mix, **kwargs):
+    with fake_gemini(config), temporary_storage(), serve_in_background(app) as base_url:
+        return asyncio.run(run_load(base_url, parse_mix(mix), seed_resumes=1, **kwargs)).to_dict()
+
+
+def test_load_runner_reports_per_endpoint():
+    report = _run_load(
+        FakeModelConfig(latency="const:0", seed=7),
+        "upload=1,tailor=1,cover=1",
+        concurrency=3,
+        max_requests=12,
+        seed=7,
+    )
+    json.dumps(report)
+    assert report["endpoints"]["total"]["requests"] == 12
+    assert report["endpoints"]["total"]["failures"] == 0
+
+
+def test_load_runner_leaves_no_files_behind():
+    import main
+
+    def stored():
+        return len(list(main.UPLOAD_PATH.iterdir())) + len(list(main.OUTPUT_PATH.iterdir()))
+
+    before = stored()
+    _run_load(FakeModelConfig(latency="const:0"), "upload=1", concurrency=2, max_requests=4)
+    assert stored() == before
+
+
+def test_load_runner_latency_includes_queueing():
+    latency_ms, concurrency = 50, 4
+    report = _run_load(
+        FakeModelConfig(latency=f"const:{latency_ms}"),
+        "tailor=1",
+        concurrency=concurrency,
+        max_requests=12,
+    )
+    tailor = report["endpoints"]["tailor"]
+    assert tailor["p50_ms"] >= latency_ms
+    # Little's law: with a closed loop of C clients, mean latency ~= C / throughput.
+    expected_ms = concurrency / tailor["throughput_rps"] * 1000
+    assert tailor["p50_ms"] >= 0.5 * expected_ms
+
+
+def test_load_runner_surfaces_model_errors():
+    report = _run_load(
+        FakeModelConfig(latency="const:0", error_rate=1.0),
+        "cover=1",
+        concurrency=2,
+        max_requests=6,
+    )
+    cover = report["endpoints"]["cover"]
+    assert cover["failures"] == 6
+    assert cover["statuses"] == {"500": 6}
+
+
+def test_base_url_rejects_fake_model_flags(capsys):
+    with pytest.raises(SystemExit):
+        loadtest_main(["--base-url", "http://127.0.0.1:1", "--error-rate", "0.1"])
+    assert "--error-rate cannot be used with --base-url" in capsys.readouterr().err
@@ -0,0 +1,137 @@
+import multiprocessing
+import time
+
+import pytest
+
+import services.pdf_service as pdf_service
+from services.pdf_service import (
+    PdfExtractionError,
+    PdfResourceLimitError,
+    PdfValidationError,
+    extract_text_sandboxed,
+    preflight_check,
+)
+from loadtest.runner import build_sample_pdf
+
+
+RESUME_LINES = ["Jane Doe", "Python engineer"]
+
+
+def test_preflight_accepts_valid_pdf():
+    preflight_check(build_sample_pdf(RESUME_LINES), max_pages=5, max_objects=100)
+
+
+def test_preflight_tolerates_slightly_off_startxref():
+    data = build_sample_pdf(RESUME_LINES)
+    head, _, offset = data.rpartition(b"startxref\n")
+    offset, _, rest = offset.partition(b"\n")
+    shifted = head + b"startxref\n%d\n" % (int(offset) - 1) + rest
+    preflight_check(shifted, max_pages=5, max_objects=100)
+
+
+@pytest.mark.parametrize("padding", [b"\0" * 2048, b"\r\n" * 4096], ids=["nul", "newlines"])
+def test_preflight_accepts_padding_after_eof(padding):
+    preflight_check(build_sample_pdf(RESUME_LINES) + padding, max_pages=5, max_objects=100)
+
+
+def test_preflight_ignores_outline_counts():
+    outline = b"<< /Type /Outlines /Count 500 >>"
+    preflight_check(build_sample_pdf(RESUME_LINES, [outline]), max_pages=5, max_objects=100)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"PK\x03\x04 not a pdf",
+        b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\n",
+        b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF",
+        b"%PDF-1.4\nstartxref\n99999\n%%EOF",
+    ],
+)
+def test_preflight_rejects_malformed(data):
+    with pytest.raises(PdfValidationError):
+        preflight_check(data, max_pages=5, max_objects=100)
+
+
+def test_preflight_enforces_limits():
+    data = build_sample_pdf(RESUME_LINES)
+    with pytest.raises(PdfValidationError, match="objects"):
+        preflight_check(data, max_pages=5, max_objects=2)
+    bloated = data.replace(b"/Count 1", b"/Count 9")
+    with pytest.raises(PdfValidationError, match="pages"):
+        preflight_check(bloated, max_pages=5, max_objects=100)
+    objstm = b"<< /Type /ObjStm /N 500 /First 10 /Length 0 >>\nstream\n\nendstream"
+    with pytest.raises(PdfValidationError, match="objects"):
+        preflight_check(build_sample_pdf(RESUME_LINES, [objstm]), max_pages=5, max_objects=100)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"<< /Type /ObjStm " + b"/N 1 " * 400_000,
+        b"/Type /ObjStm /N 1 " * 200_000,
+        b"/Type /Pages /Count 1 " * 200_000,
+        b"/Type /Pages /Count 1 endobj " * 200_000,
+    ],
+    ids=["objstm-n-flood", "objstm-marker-flood", "pages-marker-flood", "pages-object-flood"],
+)
+def test_preflight_is_linear_on_crafted_input(body):
+    data = build_sample_pdf(RESUME_LINES, [body])
+    started = time.perf_counter()
+    try:
+        preflight_check(data, max_pages=50, max_objects=20000)
+    except PdfValidationError:
+        pass
+    assert time.perf_counter() - started < 1.0
+
+
+def test_sandboxed_extraction(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(build_sample_pdf(RESUME_LINES))
+    text = extract_text_sandboxed(path, max_pages=5, cpu_seconds=10, memory_mb=512, timeout_seconds=30)
+    assert "Jane Doe" in text
+    with pytest.raises(PdfValidationError):
+        extract_text_sandboxed(path, max_pages=0, cpu_seconds=10, memory_mb=512, timeout_seconds=30)
+    with pytest.raises(PdfResourceLimitError):
+        extract_text_sandboxed(path, max_pages=5, cpu_seconds=10, memory_mb=512, timeout_seconds=0)
+    path.write_bytes(b"%PDF-1.4\nnot really a pdf")
+    with pytest.raises(PdfExtractionError, match="PdfReadError"):
+        extract_text_sandboxed(path, max_pages=5, cpu_seconds=10, memory_mb=512, timeout_seconds=30)
+
+
+def _spin(pdf_path, max_pages=None):
+    while True:
+        pass
+
+
+def _allocate(pdf_path, max_pages=None):
+    return bytearray(8 * 1024 * 1024 * 1024)
+
+
+@pytest.mark.parametrize(
+    "worker, match",
+    [(_spin, "CPU"), (_allocate, "memory")],
+)
+def test_sandbox_limits_stop_runaway_child(monkeypatch, tmp_path, worker, match):
+    # A fork child inherits the patched extract_text; forkserver children would not.
+    monkeypatch.setattr(pdf_service, "_SANDBOX_CONTEXT", multiprocessing.get_context("fork"))
+    monkeypatch.setattr(pdf_service, "extract_text", worker)
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(build_sample_pdf(RESUME_LINES))
+    with pytest.raises(PdfResourceLimitError, match=match):
+        extract_text_sandboxed(path, max_pages=5, cpu_seconds=1, memory_mb=256, timeout_seconds=30)
+
+
+
+def test_sandbox_disables_core_dumps(monkeypatch, tmp_path):
+    resource = pytest.importorskip("resource")
+
+    def core_limit(pdf_path, max_pages=None):
+        return repr(resource.getrlimit(resource.RLIMIT_CORE))
+
+    monkeypatch.setattr(pdf_service, "_SANDBOX_CONTEXT", multiprocessing.get_context("fork"))
+    monkeypatch.setattr(pdf_service, "extract_text", core_limit)
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(build_sample_pdf(RESUME_LINES))
+    result = extract_text_sandboxed(path, max_pages=5, cpu_seconds=10, memory_mb=512, timeout_seconds=30)
+    assert result == "(0, 0)"